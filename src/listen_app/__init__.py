@@ -3,12 +3,22 @@
 __version__ = "1.0.0"
 
 from .recorder import AudioRecorder
-from .transcriber import Transcriber, TranscriptionResult, ModelSize
+from .transcriber import (
+    Transcriber,
+    TranscriptionResult,
+    ModelSize,
+    LatencyMode,
+    VadMode,
+    pcm16_to_float32,
+)
 
 __all__ = [
     "AudioRecorder",
     "Transcriber",
     "TranscriptionResult",
     "ModelSize",
+    "LatencyMode",
+    "VadMode",
+    "pcm16_to_float32",
     "__version__",
 ]
@@ -13,24 +13,90 @@ Controls:
 """
 
 import argparse
+import multiprocessing
+import queue
+import signal
 import sys
 import threading
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
 
-import pyperclip
+import numpy as np
 from pynput import keyboard
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.live import Live
 from rich.text import Text
 
+from .clipboard import copy_async
 from .recorder import AudioRecorder
-from .transcriber import Transcriber, ModelSize
+from .transcriber import Transcriber, TranscriptionResult, ModelSize
 
 
 console = Console()
 
 
+# Transcriber owned by the worker process (see _worker_load)
+_worker_transcriber: Optional[Transcriber] = None
+
+
+def _init_worker() -> None:
+    """Ignore Ctrl+C in the worker process; the parent owns shutdown."""
+    # The worker shares the terminal's process group, so it gets SIGINT too
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _worker_load(model_size: Optional[ModelSize]) -> dict:
+    """Load the speech recognition model in the worker process and return its info."""
+    global _worker_transcriber
+    if _worker_transcriber is None:
+        _worker_transcriber = Transcriber(model_size=model_size)
+    return _worker_transcriber.get_model_info()
+
+
+def _worker_transcribe(audio: np.ndarray) -> TranscriptionResult:
+    """Transcribe audio in the worker process."""
+    # Keep VAD on for short push-to-talk clips too (decision D5)
+    return _worker_transcriber.transcribe(audio, vad="on")
+
+
+class _HotKeyListener:
+    """Global Ctrl+Space hotkey that also reports when either key is released."""
+
+    def __init__(
+        self, on_activate: Callable[[], None], on_release: Callable[[], None]
+    ):
+        # Canonical Ctrl and Space, as canonical() reports them; releasing
+        # either one ends a push-to-talk recording
+        self._keys = frozenset(keyboard.HotKey.parse("<ctrl>+<space>"))
+        self._hotkey = keyboard.HotKey(self._keys, on_activate)
+        self._on_hotkey_release = on_release
+        self._listener = keyboard.Listener(
+            on_press=self._on_press, on_release=self._on_release
+        )
+
+    def start(self) -> None:
+        """Start listening for key events."""
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Stop listening for key events."""
+        self._listener.stop()
+
+    def _on_press(self, key) -> None:
+        # canonical() maps left/right Ctrl to Key.ctrl, as HotKey expects
+        self._hotkey.press(self._listener.canonical(key))
+
+    def _on_release(self, key) -> None:
+        key = self._listener.canonical(key)
+        self._hotkey.release(key)
+        # Most keystrokes are neither Ctrl nor Space; bail out early
+        if key not in self._keys:
+            return
+        self._on_hotkey_release()
+
+
 class ListenApp:
     """Main application for voice-to-text transcription."""
 
@@ -56,69 +122,93 @@ class ListenApp:
         self._last_transcription = ""
         self._last_language = ""
         self._status_lock = threading.Lock()
+        # Set whenever the status display needs to be redrawn
+        self._ui_changed = threading.Event()
 
-        # Initialize components (lazy load transcriber)
+        # Display pieces are built once and reused by _get_display
+        mode = "Press" if toggle_mode else "Hold"
+        self._ready_text = Text(
+            f"🎤 Ready - {mode} Ctrl+Space to record", style="green"
+        )
+        self._recording_text = Text(
+            "🔴 Recording... (release to transcribe)", style="red bold"
+        )
+        self._processing_text = Text("⏳ Processing...", style="yellow bold")
+        self._transcription_text: Optional[Text] = None
+        self._transcription_dirty = False
+
+        # Initialize components (lazy start the transcription worker)
         self._recorder = AudioRecorder(on_status_change=self._on_recording_status)
-        self._transcriber: Optional[Transcriber] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
         self._model_size = model_size
 
-        # Keyboard state
-        self._ctrl_pressed = False
-        self._space_pressed = False
+        # Stop requests from the hotkey handlers, handled one at a time
+        self._stop_requests: queue.Queue[None] = queue.Queue()
+        threading.Thread(target=self._process_stop_requests, daemon=True).start()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Lazy start the worker process that owns the transcriber model.
 
-    def _get_transcriber(self) -> Transcriber:
-        """Lazy load the transcriber model."""
-        if self._transcriber is None:
+        Inference runs in its own process so it never holds the GIL that the
+        keyboard listener and the live display need.
+        """
+        if self._executor is None:
             console.print("[dim]Loading speech recognition model...[/dim]")
-            self._transcriber = Transcriber(model_size=self._model_size)
-            info = self._transcriber.get_model_info()
+            # spawn, not fork: the parent already holds PortAudio state
+            executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            # Load in a task rather than the pool initializer, so load errors
+            # come back from result() instead of as BrokenProcessPool
+            try:
+                info = executor.submit(_worker_load, self._model_size).result()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            self._executor = executor
             console.print(
                 f"[green]✓[/green] Model loaded: [cyan]{info['model_size']}[/cyan] "
                 f"on [cyan]{info['device']}[/cyan]"
             )
-        return self._transcriber
+        return self._executor
+
+    def _handle_error(self, error: Exception) -> None:
+        """Report a failed transcription, replacing the worker if it died."""
+        if isinstance(error, BrokenProcessPool):
+            # The worker crashed (e.g. CUDA OOM); start a fresh one next time
+            executor, self._executor = self._executor, None
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+        console.print(f"[red]Error: {error}[/red]")
 
     def _on_recording_status(self, status: str) -> None:
         """Handle recording status changes."""
         with self._status_lock:
             self._recording = status == "recording"
+        self._ui_changed.set()
 
     def _get_display(self) -> Panel:
         """Generate the status display panel."""
         with self._status_lock:
             if self._processing:
-                status = Text("⏳ Processing...", style="yellow bold")
+                status = self._processing_text
             elif self._recording:
-                status = Text(
-                    "🔴 Recording... (release to transcribe)", style="red bold"
-                )
+                status = self._recording_text
+            else:
+                status = self._ready_text
+
+            # Only rebuild the transcription text when it has changed
+            if self._transcription_dirty:
+                self._transcription_text = self._build_transcription_text()
+                self._transcription_dirty = False
+
+            if self._transcription_text:
+                content = Group(status, self._transcription_text)
             else:
-                mode = "Press" if self.toggle_mode else "Hold"
-                status = Text(f"🎤 Ready - {mode} Ctrl+Space to record", style="green")
-
-            content = Text()
-            content.append(status)
-
-            if self._last_transcription:
-                content.append("\n\n")
-                content.append("Last transcription:\n", style="dim")
-                content.append(f'"{self._last_transcription}"', style="white")
-                if self.auto_copy:
-                    content.append(" ", style="dim")
-                    content.append("(copied to clipboard)", style="dim italic")
-                if self._last_language:
-                    lang_names = {
-                        "ar": "Arabic",
-                        "en": "English",
-                        "fr": "French",
-                        "es": "Spanish",
-                        "de": "German",
-                        "zh": "Chinese",
-                    }
-                    lang_display = lang_names.get(
-                        self._last_language, self._last_language.upper()
-                    )
-                    content.append(f" [{lang_display}]", style="cyan")
+                content = status
 
             return Panel(
                 content,
@@ -127,6 +217,32 @@ class ListenApp:
                 border_style="blue",
             )
 
+    def _build_transcription_text(self) -> Optional[Text]:
+        """Build the "Last transcription" part of the display."""
+        if not self._last_transcription:
+            return None
+
+        content = Text("\n")
+        content.append("Last transcription:\n", style="dim")
+        content.append(f'"{self._last_transcription}"', style="white")
+        if self.auto_copy:
+            content.append(" ", style="dim")
+            content.append("(copied to clipboard)", style="dim italic")
+        if self._last_language:
+            lang_names = {
+                "ar": "Arabic",
+                "en": "English",
+                "fr": "French",
+                "es": "Spanish",
+                "de": "German",
+                "zh": "Chinese",
+            }
+            lang_display = lang_names.get(
+                self._last_language, self._last_language.upper()
+            )
+            content.append(f" [{lang_display}]", style="cyan")
+        return content
+
     def _start_recording(self) -> None:
         """Start audio recording."""
         if not self._recording and not self._processing:
@@ -137,72 +253,73 @@ class ListenApp:
         if self._recording:
             with self._status_lock:
                 self._processing = True
+            self._ui_changed.set()
 
-            # Stop recording and get audio
-            audio_data = self._recorder.stop()
+            try:
+                # Stop recording and get audio samples
+                audio = self._recorder.stop_ndarray()
 
-            if len(audio_data) > 1000:  # Minimum audio length check
-                try:
-                    transcriber = self._get_transcriber()
-                    result = transcriber.transcribe(audio_data)
+                if audio.size:  # Empty if the recording was too short
+                    future = self._get_executor().submit(_worker_transcribe, audio)
+                    future.add_done_callback(self._on_transcription_done)
+                    return
 
-                    self._last_transcription = result.text
-                    self._last_language = result.language
+                with self._status_lock:
+                    self._last_transcription = "(no audio captured)"
+                    self._transcription_dirty = True
 
-                    if self.auto_copy and result.text:
-                        pyperclip.copy(result.text)
-
-                except Exception as e:
-                    console.print(f"[red]Error: {e}[/red]")
-            else:
-                self._last_transcription = "(no audio captured)"
+            except Exception as e:
+                self._handle_error(e)
 
             with self._status_lock:
                 self._processing = False
+            self._ui_changed.set()
 
-    def _on_key_press(self, key) -> None:
-        """Handle key press events."""
-        try:
-            if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r:
-                self._ctrl_pressed = True
-            elif key == keyboard.Key.space:
-                self._space_pressed = True
-
-            # Check for Ctrl+Space
-            if self._ctrl_pressed and self._space_pressed:
-                if self.toggle_mode:
-                    # Toggle mode: start or stop
-                    if self._recording:
-                        threading.Thread(
-                            target=self._stop_recording_and_transcribe, daemon=True
-                        ).start()
-                    else:
-                        self._start_recording()
-                else:
-                    # Push-to-talk: start recording
-                    self._start_recording()
-        except AttributeError:
-            pass
+    def _request_stop(self) -> None:
+        """Queue a stop for the dispatcher thread (hotkey handlers must not block)."""
+        if self._recording and not self._processing:
+            self._stop_requests.put(None)
+
+    def _process_stop_requests(self) -> None:
+        """Dispatcher thread: stop recording and submit audio, one request at a time."""
+        while True:
+            self._stop_requests.get()
+            self._stop_recording_and_transcribe()
 
-    def _on_key_release(self, key) -> None:
-        """Handle key release events."""
+    def _on_transcription_done(self, future: Future) -> None:
+        """Handle a finished transcription from the worker process."""
         try:
-            if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r:
-                self._ctrl_pressed = False
-                # In push-to-talk mode, stop when Ctrl is released
-                if not self.toggle_mode and self._recording:
-                    threading.Thread(
-                        target=self._stop_recording_and_transcribe, daemon=True
-                    ).start()
-            elif key == keyboard.Key.space:
-                self._space_pressed = False
-                # In push-to-talk mode, also stop when Space is released
-                if not self.toggle_mode and self._recording:
-                    threading.Thread(
-                        target=self._stop_recording_and_transcribe, daemon=True
-                    ).start()
-        except AttributeError:
-            pass
+            result = future.result()
+
+            # Update together so _get_display never mixes old and new
+            with self._status_lock:
+                self._last_transcription = result.text
+                self._last_language = result.language
+                self._transcription_dirty = True
+
+            if self.auto_copy and result.text:
+                copy_async(result.text)
+
+        except Exception as e:
+            self._handle_error(e)
+
+        with self._status_lock:
+            self._processing = False
+        self._ui_changed.set()
+
+    def _on_hotkey_press(self) -> None:
+        """Handle Ctrl+Space being pressed."""
+        if self.toggle_mode and self._recording:
+            # Toggle mode: second press stops
+            self._request_stop()
+        else:
+            self._start_recording()
+
+    def _on_hotkey_release(self) -> None:
+        """Handle Ctrl or Space being released."""
+        # In push-to-talk mode, stop when either key is released
+        if not self.toggle_mode:
+            self._request_stop()
 
     def run(self) -> None:
         """Run the main application loop."""
@@ -217,13 +334,13 @@ class ListenApp:
         )
 
         # Pre-load the model
-        self._get_transcriber()
+        self._get_executor()
 
         console.print()
 
-        # Start keyboard listener
-        listener = keyboard.Listener(
-            on_press=self._on_key_press, on_release=self._on_key_release
+        # Start global hotkey listener
+        listener = _HotKeyListener(
+            on_activate=self._on_hotkey_press, on_release=self._on_hotkey_release
         )
         listener.start()
 
@@ -232,12 +349,18 @@ class ListenApp:
                 self._get_display(), refresh_per_second=4, console=console
             ) as live:
                 while self._running:
-                    live.update(self._get_display())
+                    # Rebuild only on state changes; the timeout keeps
+                    # Ctrl+C and _running checks responsive
+                    if self._ui_changed.wait(timeout=0.25):
+                        self._ui_changed.clear()
+                        live.update(self._get_display())
         except KeyboardInterrupt:
             pass
         finally:
             listener.stop()
             self._recorder.terminate()
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
             console.print("\n[dim]Goodbye![/dim]")
 
 
@@ -0,0 +1,15 @@
+"""Clipboard helper shared by the CLI and GUI."""
+
+import threading
+
+import pyperclip
+
+
+def copy_async(text: str) -> None:
+    """
+    Copy text to the clipboard without blocking the caller.
+
+    pyperclip shells out to xclip/xsel/wl-copy, which takes a few ms. The
+    thread is not a daemon so a copy started just before exit still finishes.
+    """
+    threading.Thread(target=pyperclip.copy, args=(text,)).start()
@@ -1,17 +1,17 @@
 """GTK4 GUI for Listen voice-to-text application."""
 
 import threading
-import struct
+from collections import deque
 from typing import Optional
 
 import gi
+import numpy as np
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, GLib, Gdk
 
-import pyperclip
-
+from .clipboard import copy_async
 from .recorder import AudioRecorder
 from .transcriber import Transcriber, ModelSize
 
@@ -19,10 +19,22 @@ from .transcriber import Transcriber, ModelSize
 class WaveformDrawingArea(Gtk.DrawingArea):
     """Custom widget for displaying audio waveform."""
 
+    # Use every Nth sample for the RMS; plenty for a 100-point display
+    RMS_STRIDE = 8
+    # Most chunks kept while the main loop is busy; older ones are dropped
+    MAX_PENDING = 32
+
     def __init__(self):
         super().__init__()
-        self._samples = []
         self._max_samples = 100
+        # Fixed-size ring buffer of recent amplitudes
+        self._samples = np.zeros(self._max_samples, dtype=np.float32)
+        self._head = 0  # Next write position
+        self._count = 0  # Number of valid samples
+        # Chunks queued from the audio thread, drained on the frame clock
+        self._pending: deque[bytes] = deque(maxlen=self.MAX_PENDING)
+        self._dirty = False
+        self._tick_id: Optional[int] = None
         self.set_draw_func(self._draw)
         self.set_content_width(380)
         self.set_content_height(100)
@@ -34,7 +46,7 @@ class WaveformDrawingArea(Gtk.DrawingArea):
         cr.rectangle(0, 0, width, height)
         cr.fill()
 
-        if not self._samples:
+        if not self._count:
             # Draw center line when idle
             cr.set_source_rgb(0.3, 0.3, 0.4)
             cr.set_line_width(1)
@@ -48,46 +60,82 @@ class WaveformDrawingArea(Gtk.DrawingArea):
         cr.set_line_width(2)
 
         sample_width = width / self._max_samples
-        center_y = height / 2
-
-        cr.move_to(0, center_y)
-        for i, sample in enumerate(self._samples):
-            x = i * sample_width
-            # Scale amplitude to fit height
-            amplitude = sample * (height / 2) * 0.9
-            cr.line_to(x, center_y - amplitude)
-
+        samples = self._ordered_samples()
+        # Scale amplitudes to fit height
+        xs = np.arange(samples.size) * sample_width
+        amplitudes = samples * (height / 2) * 0.9
+
+        # Build the top half once, relative to the center line
+        cr.save()
+        cr.translate(0, height / 2)
+        cr.move_to(0, 0)
+        for x, amplitude in zip(xs.tolist(), amplitudes.tolist()):
+            cr.line_to(x, -amplitude)
+        path = cr.copy_path()
         cr.stroke()
 
-        # Draw mirror (bottom half)
+        # Draw mirror (bottom half) by replaying the path flipped vertically
         cr.set_source_rgba(0.4, 0.8, 0.4, 0.5)
-        cr.move_to(0, center_y)
-        for i, sample in enumerate(self._samples):
-            x = i * sample_width
-            amplitude = sample * (height / 2) * 0.9
-            cr.line_to(x, center_y + amplitude)
+        cr.scale(1, -1)
+        cr.append_path(path)
         cr.stroke()
+        cr.restore()
+
+    def _ordered_samples(self) -> np.ndarray:
+        """Return the buffered amplitudes ordered from oldest to newest."""
+        if self._count < self._max_samples:
+            return self._samples[: self._count]
+        return np.roll(self._samples, -self._head)
 
     def add_samples(self, audio_data: bytes):
         """Add audio samples to the waveform display."""
-        # Convert bytes to normalized amplitude values
-        samples = struct.unpack(f"{len(audio_data) // 2}h", audio_data)
+        # View every Nth int16 sample without copying
+        samples = np.frombuffer(audio_data, dtype=np.int16)[:: self.RMS_STRIDE]
 
         # Calculate RMS amplitude for this chunk
-        if samples:
-            rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
+        if samples.size:
+            rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float32))))
             normalized = min(rms / 32768.0 * 3, 1.0)  # Amplify for visibility
-            self._samples.append(normalized)
-
-            # Keep only recent samples
-            if len(self._samples) > self._max_samples:
-                self._samples = self._samples[-self._max_samples :]
-
-        self.queue_draw()
+            self._samples[self._head] = normalized
+            self._head = (self._head + 1) % self._max_samples
+            self._count = min(self._count + 1, self._max_samples)
+            self._dirty = True
+
+    def queue_samples(self, audio_data: bytes):
+        """Queue an audio chunk for display (safe to call from any thread)."""
+        self._pending.append(audio_data)
+
+    def start_updates(self):
+        """Start draining queued chunks once per display frame."""
+        if self._tick_id is None:
+            self._tick_id = self.add_tick_callback(self._on_tick)
+
+    def stop_updates(self):
+        """Stop frame updates after showing any chunks still queued."""
+        if self._tick_id is not None:
+            self.remove_tick_callback(self._tick_id)
+            self._tick_id = None
+        self._flush()
+
+    def _on_tick(self, widget, frame_clock):
+        """Frame clock callback - redraw at most once per frame."""
+        self._flush()
+        return GLib.SOURCE_CONTINUE
+
+    def _flush(self):
+        """Add all queued chunks and redraw if anything changed."""
+        while self._pending:
+            self.add_samples(self._pending.popleft())
+        if self._dirty:
+            self._dirty = False
+            self.queue_draw()
 
     def clear(self):
         """Clear the waveform display."""
-        self._samples = []
+        self._pending.clear()
+        self._head = 0
+        self._count = 0
+        self._dirty = False
         self.queue_draw()
 
 
@@ -362,6 +410,7 @@ class ListenGUI(Adw.Application):
         self.status_label.set_text("Recording... Click to transcribe")
         self.result_label.set_text("")
         self.waveform.clear()
+        self.waveform.start_updates()
 
         # Start recording with callback for waveform
         self._recorder._on_audio_chunk = self._on_audio_chunk
@@ -369,7 +418,7 @@ class ListenGUI(Adw.Application):
 
     def _on_audio_chunk(self, data: bytes):
         """Handle incoming audio chunk for waveform."""
-        GLib.idle_add(self.waveform.add_samples, data)
+        self.waveform.queue_samples(data)
 
     def _stop_and_transcribe(self):
         """Stop recording and transcribe."""
@@ -379,25 +428,27 @@ class ListenGUI(Adw.Application):
         self.action_button.remove_css_class("destructive-action")
         self.action_button.set_sensitive(False)
         self.status_label.set_text("Processing audio...")
+        self.waveform.stop_updates()
 
         # Stop and transcribe in background
         threading.Thread(target=self._transcribe_audio, daemon=True).start()
 
     def _transcribe_audio(self):
         """Transcribe recorded audio (runs in background thread)."""
-        audio_data = self._recorder.stop()
+        audio = self._recorder.stop_ndarray()
 
-        if len(audio_data) < 1000:
+        if not audio.size:  # Empty if the recording was too short
             GLib.idle_add(self._on_transcription_complete, "(no audio captured)")
             return
 
         try:
-            result = self._transcriber.transcribe(audio_data)
+            # Keep VAD on for short push-to-talk clips too (decision D5)
+            result = self._transcriber.transcribe(audio, vad="on")
             text = result.text.strip()
             language = result.language
 
             if self.auto_copy and text:
-                pyperclip.copy(text)
+                copy_async(text)
 
             GLib.idle_add(self._on_transcription_complete, text, language)
         except Exception as e:
@@ -443,7 +494,7 @@ class ListenGUI(Adw.Application):
         if self._last_transcription and not self._last_transcription.startswith(
             "Error:"
         ):
-            pyperclip.copy(self._last_transcription)
+            copy_async(self._last_transcription)
 
         self._state = self.STATE_READY
         self._last_transcription = ""
@@ -1,10 +1,10 @@
 """Audio recording module for voice-to-text transcription."""
 
-import io
-import wave
+import struct
 import threading
 from typing import Optional, Callable
 
+import numpy as np
 import pyaudio
 
 
@@ -16,6 +16,31 @@ class AudioRecorder:
     CHANNELS = 1
     CHUNK_SIZE = 1024
     FORMAT = pyaudio.paInt16
+    SAMPLE_WIDTH = 2  # Bytes per paInt16 sample
+
+    # Recordings with less PCM than this (~30ms) are treated as accidental taps
+    MIN_AUDIO_BYTES = 1000
+
+    # Size of the canonical PCM WAV header (RIFF + fmt + data chunk headers)
+    WAV_HEADER_SIZE = 44
+
+    # WAV header for the format above; size fields are patched at stop()
+    _WAV_HEADER = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        WAV_HEADER_SIZE - 8,  # RIFF chunk size
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        CHANNELS,
+        SAMPLE_RATE,
+        SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH,  # Byte rate
+        CHANNELS * SAMPLE_WIDTH,  # Block align
+        SAMPLE_WIDTH * 8,  # Bits per sample
+        b"data",
+        0,  # data chunk size
+    )
 
     def __init__(
         self,
@@ -34,8 +59,11 @@ class AudioRecorder:
         with self._alsa_error_handler():
             self._audio = pyaudio.PyAudio()
 
+        # Input stream, kept open across recordings once created
         self._stream: Optional[pyaudio.Stream] = None
-        self._frames: list[bytes] = []
+        self._stream_device: Optional[int] = None
+        # WAV header followed by the raw PCM of the current recording
+        self._buf = bytearray(self._WAV_HEADER)
         self._is_recording = False
         self._lock = threading.Lock()
         self._on_status_change = on_status_change
@@ -84,25 +112,31 @@ class AudioRecorder:
             if self._is_recording:
                 return
 
-            self._frames = []
+            self._buf = bytearray(self._WAV_HEADER)
             self._is_recording = True
 
-            self._stream = self._audio.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.SAMPLE_RATE,
-                input=True,
-                input_device_index=input_device_index,
-                frames_per_buffer=self.CHUNK_SIZE,
-                stream_callback=self._audio_callback,
-            )
+            # Opening a stream is slow (device probe, format negotiation),
+            # so reuse it unless a different device is requested
+            if self._stream is None or self._stream_device != input_device_index:
+                self._close_stream()
+                self._stream = self._audio.open(
+                    format=self.FORMAT,
+                    channels=self.CHANNELS,
+                    rate=self.SAMPLE_RATE,
+                    input=True,
+                    input_device_index=input_device_index,
+                    frames_per_buffer=self.CHUNK_SIZE,
+                    stream_callback=self._audio_callback,
+                    start=False,
+                )
+                self._stream_device = input_device_index
             self._stream.start_stream()
             self._notify_status("recording")
 
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Callback for audio stream - stores audio frames."""
         if self._is_recording:
-            self._frames.append(in_data)
+            self._buf.extend(in_data)
             if self._on_audio_chunk:
                 self._on_audio_chunk(in_data)
         return (None, pyaudio.paContinue)
@@ -112,35 +146,61 @@ class AudioRecorder:
         Stop recording and return the audio data as WAV bytes.
 
         Returns:
-            WAV file contents as bytes
+            WAV file contents as bytes (empty if not recording or too short)
         """
         with self._lock:
-            if not self._is_recording:
+            if not self._stop_stream() or not self._has_audio():
                 return b""
 
-            self._is_recording = False
+            # Convert frames to WAV format in memory
+            return self._frames_to_wav()
 
-            if self._stream:
-                self._stream.stop_stream()
-                self._stream.close()
-                self._stream = None
+    def stop_ndarray(self) -> np.ndarray:
+        """
+        Stop recording and return the audio as float32 samples.
 
-            self._notify_status("stopped")
+        Whisper consumes 16kHz mono float32 directly, so this skips
+        encoding a WAV only for it to be decoded again.
 
-            # Convert frames to WAV format in memory
-            return self._frames_to_wav()
+        Returns:
+            1-D float32 array in [-1.0, 1.0] (empty if not recording or too short)
+        """
+        with self._lock:
+            if not self._stop_stream() or not self._has_audio():
+                return np.zeros(0, dtype=np.float32)
 
-    def _frames_to_wav(self) -> bytes:
-        """Convert recorded frames to WAV format bytes."""
-        buffer = io.BytesIO()
+            pcm = np.frombuffer(self._buf, dtype=np.int16, offset=self.WAV_HEADER_SIZE)
+            return pcm.astype(np.float32) / 32768.0
 
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self._audio.get_sample_size(self.FORMAT))
-            wf.setframerate(self.SAMPLE_RATE)
-            wf.writeframes(b"".join(self._frames))
+    def _has_audio(self) -> bool:
+        """Check whether the last recording is long enough to transcribe."""
+        return len(self._buf) - self.WAV_HEADER_SIZE >= self.MIN_AUDIO_BYTES
 
-        return buffer.getvalue()
+    def _stop_stream(self) -> bool:
+        """Stop the input stream. Returns False if not recording."""
+        if not self._is_recording:
+            return False
+
+        self._is_recording = False
+
+        if self._stream:
+            self._stream.stop_stream()
+
+        self._notify_status("stopped")
+        return True
+
+    def _close_stream(self) -> None:
+        """Close the input stream if one is open."""
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    def _frames_to_wav(self) -> bytes:
+        """Finalize the in-memory WAV and return it as bytes."""
+        struct.pack_into("<I", self._buf, 4, len(self._buf) - 8)
+        data_size = len(self._buf) - self.WAV_HEADER_SIZE
+        struct.pack_into("<I", self._buf, self.WAV_HEADER_SIZE - 4, data_size)
+        return bytes(self._buf)
 
     def save_to_file(self, filepath: str) -> None:
         """
@@ -159,8 +219,7 @@ class AudioRecorder:
 
     def terminate(self) -> None:
         """Clean up PyAudio resources."""
-        if self._stream:
-            self._stream.close()
+        self._close_stream()
         self._audio.terminate()
 
     def __enter__(self):
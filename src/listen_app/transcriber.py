@@ -1,18 +1,289 @@
-"""Speech-to-text transcription module using faster-whisper."""
+"""
+Speech-to-text transcription module using faster-whisper.
 
+CTranslate2 backend setting (set only if not already in the environment):
+
+    CT2_CUDA_ALLOCATOR=cuda_malloc_async
+        Stream-ordered CUDA allocation, so decoder cache growth doesn't stall
+        kernel launches behind cudaMalloc on drivers where it isn't the default.
+"""
+
+import functools
 import io
+import os
 import subprocess
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator, Optional, Literal
+
+import numpy as np
+
+# faster_whisper pulls in CTranslate2, tokenizers and onnxruntime (~1-2s), so
+# it is only imported once a model is actually needed
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from faster_whisper.transcribe import Segment, TranscriptionInfo
+
+
+def _physical_cores() -> int:
+    """Number of physical CPU cores (logical count if psutil is unavailable)."""
+    try:
+        import psutil
+
+        cores = psutil.cpu_count(logical=False)
+        if cores:
+            return cores
+    except ImportError:
+        pass
+    return os.cpu_count() or 1
 
-from faster_whisper import WhisperModel
+
+# Hyperthread oversubscription hurts int8 GEMM throughput; must be set before
+# CTranslate2 initializes OpenMP (it is only imported inside functions)
+os.environ.setdefault("OMP_NUM_THREADS", str(_physical_cores()))
 
 
 # Available model sizes
 ModelSize = Literal["tiny", "base", "small", "medium", "large-v3"]
 
+# Decoding presets, trading accuracy for speed
+LatencyMode = Literal["quality", "balanced", "latency"]
+
+_DECODE_OPTIONS = {
+    # Arabic-optimized wide beam search (the default)
+    "quality": dict(beam_size=8, patience=1.5),
+    # faster-whisper's standard beam width
+    "balanced": dict(beam_size=5),
+    # Greedy decoding, no temperature fallback: ~5x fewer decoder passes
+    "latency": dict(beam_size=1, best_of=1, temperature=0.0),
+}
+
+# Silence filtering: 'auto' skips VAD on clips too short to contain silence
+# worth removing (Silero's defaults can also drop short utterances entirely)
+VadMode = Literal["auto", "on", "off"]
+
+_VAD_MIN_DURATION = 3.0
+_VAD_PARAMETERS = {
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 200,
+    "threshold": 0.5,
+}
+
+# Whisper's native input sample rate
+_SAMPLE_RATE = 16000
+
+# Clips shorter than this are decoded directly; batching overhead dominates
+_BATCH_MIN_DURATION = 5.0
+
+# transcribe_chunks: longest window re-decoded per step (Whisper's input size),
+# committed words carried over as the prompt (~200 tokens), and how far a
+# re-decoded word may end past the last committed one and still be a repeat
+_CHUNK_MAX_WINDOW = 30.0
+_CHUNK_PROMPT_WORDS = 150
+_CHUNK_WORD_TOLERANCE = 0.1
+
+
+# Only the most recent model is kept, so switching sizes in the GUI doesn't
+# leave several models resident in VRAM
+@functools.lru_cache(maxsize=1)
+def _load_whisper(
+    model_size: str, device: str, compute_type: str, num_workers: int
+) -> "WhisperModel":
+    """
+    Load a Whisper model, retrying with a safe compute type if needed.
+
+    'auto' lets CTranslate2 pick the fastest type the device supports
+    (e.g. int8_float16 on Tensor Core GPUs), but an explicitly requested type
+    may be rejected by older hardware or backends.
+
+    Loaded models are cached and shared between Transcriber instances. This is
+    safe: WhisperModel.transcribe keeps no state between calls, including
+    language detection.
+    """
+    from faster_whisper import WhisperModel
+
+    # One thread per physical core for CPU inference; on CUDA the CPU only
+    # handles feature extraction and VAD
+    cpu_threads = 4 if device == "cuda" else _physical_cores()
+    options = dict(device=device, cpu_threads=cpu_threads, num_workers=num_workers)
+
+    try:
+        return WhisperModel(model_size, compute_type=compute_type, **options)
+    except ValueError as e:
+        fallback = "int8_float16" if device == "cuda" else "int8"
+        if "compute type" not in str(e) or compute_type == fallback:
+            raise
+        return WhisperModel(model_size, compute_type=fallback, **options)
+
+
+# Set once CUDA has failed to load, so auto-detection stops offering it
+_cuda_disabled = False
+
+
+@functools.cache
+def _detect_device() -> str:
+    """Detect available compute device (cached; torch import alone is slow)."""
+    if _cuda_disabled:
+        return "cpu"
+
+    # ctranslate2 is cheapest: it counts devices without creating a context
+    try:
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda"
+    except ImportError:
+        pass
+
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            return "cuda"
+    except ImportError:
+        pass
+
+    return "cpu"
+
+
+# Downgrades for compute types a GPU can't run (e.g. "Allow INT8: false")
+_CUDA_COMPUTE_FALLBACKS = {
+    "int8": ("int8_float16", "float16"),
+    "int8_float16": ("float16",),
+    "int8_bfloat16": ("bfloat16", "float16"),
+}
+
+
+def _probe_cuda_compute_type(compute_type: str) -> Optional[str]:
+    """
+    Check which compute type CUDA can run, without loading any weights.
+
+    Returns compute_type if supported, otherwise the nearest supported
+    downgrade. Returns None if CUDA is not usable at all.
+    """
+    try:
+        import ctranslate2
+
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except Exception:
+        return None
+
+    if compute_type == "auto" or compute_type in supported:
+        return compute_type
+    for fallback in _CUDA_COMPUTE_FALLBACKS.get(compute_type, ()):
+        if fallback in supported:
+            return fallback
+    return compute_type  # Let WhisperModel report the unsupported type
+
+
+def _disable_cuda() -> None:
+    """Make later auto-detection pick the CPU after CUDA failed to load."""
+    global _cuda_disabled
+    _cuda_disabled = True
+    _detect_device.cache_clear()
+
+
+# Keys reported by _query_gpu_info
+_GPU_INFO_KEYS = ("gpu_name", "gpu_memory_mb", "cuda_version", "driver_version")
+
 
-@dataclass
+def _query_gpu_info_nvml() -> dict:
+    """Query GPU 0 in-process through NVML (requires nvidia-ml-py)."""
+    import pynvml
+
+    def as_str(value) -> str:
+        # Older pynvml releases return bytes
+        return value.decode() if isinstance(value, bytes) else value
+
+    pynvml.nvmlInit()
+    try:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        cuda = pynvml.nvmlSystemGetCudaDriverVersion()  # e.g. 12020
+        return {
+            "gpu_name": as_str(pynvml.nvmlDeviceGetName(handle)),
+            "gpu_memory_mb": memory.total // (1024 * 1024),
+            "cuda_version": f"{cuda // 1000}.{cuda % 1000 // 10}",
+            "driver_version": as_str(pynvml.nvmlSystemGetDriverVersion()),
+        }
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def _query_gpu_info_smi() -> dict:
+    """Query GPU 0 by parsing nvidia-smi output."""
+    info = dict.fromkeys(_GPU_INFO_KEYS)
+
+    result = subprocess.run(
+        [
+            "nvidia-smi",
+            "--query-gpu=name,memory.total,driver_version",
+            "--format=csv,noheader,nounits",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+    if result.returncode == 0:
+        parts = result.stdout.strip().split("\n")[0].split(", ")
+        if len(parts) >= 3:
+            info["gpu_name"] = parts[0].strip()
+            info["gpu_memory_mb"] = int(parts[1].strip())
+            info["driver_version"] = parts[2].strip()
+
+    # CUDA version from nvidia-smi header
+    result = subprocess.run(
+        ["nvidia-smi"],
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+    if result.returncode == 0:
+        for line in result.stdout.split("\n"):
+            if "CUDA Version:" in line:
+                cuda_part = line.split("CUDA Version:")[1].strip()
+                info["cuda_version"] = cuda_part.split()[0].strip()
+                break
+
+    return info
+
+
+@functools.cache
+def _query_gpu_info() -> dict:
+    """
+    Get name, memory (MB), CUDA and driver version of GPU 0.
+
+    Uses NVML when pynvml is installed, falling back to nvidia-smi. The result
+    is cached since the hardware doesn't change while running. Values are None
+    if detection fails.
+    """
+    try:
+        return _query_gpu_info_nvml()
+    except Exception:
+        pass  # pynvml not installed or NVML unavailable
+
+    try:
+        return _query_gpu_info_smi()
+    except Exception:
+        # Fallback silently if nvidia-smi fails
+        return dict.fromkeys(_GPU_INFO_KEYS)
+
+
+def pcm16_to_float32(data: bytes) -> np.ndarray:
+    """
+    Convert raw 16kHz mono int16 PCM bytes to float32 samples.
+
+    Use this for headerless PCM, then pass the array to Transcriber; bytes
+    given to Transcriber directly are always decoded as an audio file.
+    """
+    if len(data) % 2:
+        raise ValueError(
+            "Raw PCM audio must be 16-bit samples "
+            f"(got an odd length of {len(data)} bytes)"
+        )
+    return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+@dataclass(frozen=True, slots=True)
 class TranscriptionResult:
     """Result of a transcription operation."""
 
@@ -33,6 +304,9 @@ class Transcriber:
         model_size: Optional[ModelSize] = None,
         device: Literal["auto", "cpu", "cuda"] = "auto",
         compute_type: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        num_workers: int = 1,
+        warmup: bool = True,
     ):
         """
         Initialize the transcriber with a Whisper model.
@@ -42,83 +316,89 @@ class Transcriber:
                         based on device and GPU memory.
             device: Device to run inference on ('auto', 'cpu', 'cuda')
             compute_type: Computation type (e.g., 'int8', 'float16', 'float32').
-                          If None, auto-selects based on device.
+                          If None, CTranslate2 picks the fastest supported type.
+            batch_size: Number of VAD chunks decoded together for longer clips.
+                        If None, uses 8 on CUDA and 4 on CPU.
+            num_workers: Number of model replicas for concurrent transcribe()
+                         calls. 1 gives the lowest latency per call.
+            warmup: If True, run a short dummy transcription after loading so
+                    the first real call doesn't pay CUDA/kernel setup costs.
         """
         # Determine device
         if device == "auto":
-            device = self._detect_device()
+            device = _detect_device()
+
+        # Let CTranslate2 pick the fastest compute type for the device
+        if compute_type is None:
+            compute_type = "auto"
+
+        # Check CUDA support up front instead of failing halfway through a load
+        if device == "cuda":
+            cuda_compute_type = _probe_cuda_compute_type(compute_type)
+            if cuda_compute_type is None:
+                _disable_cuda()
+                print("Warning: CUDA not available, falling back to CPU")
+                device = "cpu"
+            else:
+                compute_type = cuda_compute_type
 
         # Auto-select model based on device and GPU memory
         if model_size is None:
             model_size = self._detect_best_model(device)
 
-        # Auto-select compute type
-        if compute_type is None:
-            compute_type = "float16" if device == "cuda" else "int8"
-
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.num_workers = num_workers
+
+        # Must be set before the model creates its CUDA allocator
+        if device == "cuda":
+            os.environ.setdefault("CT2_CUDA_ALLOCATOR", "cuda_malloc_async")
 
-        # Load the model with fallback to CPU if CUDA libraries are missing
+        # Load the model with fallback to CPU if CUDA libraries the probe
+        # can't see (e.g. cuDNN) are missing
         try:
-            self._model = WhisperModel(
-                model_size, device=device, compute_type=compute_type
-            )
+            self._model = _load_whisper(model_size, device, compute_type, num_workers)
         except Exception as e:
             error_str = str(e).lower()
             if "cuda" in error_str or "cublas" in error_str or "cudnn" in error_str:
                 # CUDA libraries not available, fall back to CPU
+                _disable_cuda()
                 print(
                     f"Warning: CUDA libraries not available ({e}), falling back to CPU"
                 )
                 self.device = "cpu"
-                self.compute_type = "int8"
                 self.model_size = "tiny"
-                self._model = WhisperModel(
-                    self.model_size, device="cpu", compute_type="int8"
+                self._model = _load_whisper(
+                    self.model_size, "cpu", "auto", num_workers
                 )
             else:
                 raise
 
-    def _detect_device(self) -> str:
-        """Detect available compute device."""
-        try:
-            import ctranslate2
+        # Report the compute type CTranslate2 actually chose
+        self.compute_type = getattr(
+            self._model.model, "compute_type", self.compute_type
+        )
 
-            if ctranslate2.get_cuda_device_count() > 0:
-                return "cuda"
-        except ImportError:
-            pass
+        # Batched pipeline decodes VAD-split chunks of long clips together
+        from faster_whisper import BatchedInferencePipeline
 
-        try:
-            import torch
+        self._pipeline = BatchedInferencePipeline(model=self._model)
+        if batch_size is None:
+            batch_size = 8 if self.device == "cuda" else 4
+        self.batch_size = batch_size
 
-            if torch.cuda.is_available():
-                return "cuda"
-        except ImportError:
-            pass
+        if warmup:
+            self.warmup()
 
-        return "cpu"
+    @classmethod
+    def release(cls) -> None:
+        """Drop the cached model so its memory can be freed (e.g. in tests)."""
+        _load_whisper.cache_clear()
 
     def _get_gpu_memory(self) -> int:
         """Get available GPU memory in MB. Returns 0 if detection fails."""
-        try:
-            result = subprocess.run(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=memory.total",
-                    "--format=csv,noheader,nounits",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return int(result.stdout.strip().split("\n")[0])
-        except Exception:
-            pass
-        return 0
+        return _query_gpu_info()["gpu_memory_mb"] or 0
 
     def _detect_best_model(self, device: str) -> str:
         """
@@ -140,38 +420,47 @@ class Transcriber:
             return "base"  # Low VRAM fallback
 
     def transcribe(
-        self, audio_source: str | bytes, language: Optional[str] = None
+        self,
+        audio_source: str | bytes | np.ndarray,
+        language: Optional[str] = None,
+        latency_mode: LatencyMode = "quality",
+        vad: VadMode = "auto",
+        min_language_probability: Optional[float] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio to text with Arabic-optimized settings.
 
         Args:
-            audio_source: Either a file path (str) or WAV audio data (bytes)
+            audio_source: A file path (str), WAV audio data (bytes), or
+                          16kHz mono float32 samples (np.ndarray). Convert
+                          raw PCM with pcm16_to_float32() first.
             language: Optional language code (e.g., 'en', 'ar'). If None, auto-detects.
+            latency_mode: Decoding preset: 'quality' (wide beam search),
+                          'balanced' (beam of 5) or 'latency' (greedy)
+            vad: Silence filtering: 'on', 'off', or 'auto' (on for clips
+                 of 3 seconds or more)
+            min_language_probability: If set and the language is auto-detected
+                                      with a lower probability, return empty
+                                      text without decoding (e.g. noise or
+                                      unsupported speech)
 
         Returns:
             TranscriptionResult with transcribed text and metadata
         """
-        # Handle bytes input by writing to a temporary buffer
-        if isinstance(audio_source, bytes):
-            audio_source = io.BytesIO(audio_source)
-
-        # Transcribe with Arabic-optimized settings
-        segments, info = self._model.transcribe(
-            audio_source,
-            language=language,
-            beam_size=8,  # Increased for better accuracy on complex languages
-            patience=1.5,  # More thorough search
-            condition_on_previous_text=False,  # Prevents hallucination in Arabic
-            vad_filter=True,  # Filter out silence
+        segments, info = self._transcribe_segments(
+            audio_source, language, latency_mode, vad
         )
 
-        # Collect all text segments
-        text_parts = []
-        for segment in segments:
-            text_parts.append(segment.text.strip())
+        if self._language_rejected(language, info, min_language_probability):
+            return TranscriptionResult(
+                text="",
+                language=info.language,
+                language_probability=info.language_probability,
+                duration=info.duration,
+            )
 
-        full_text = " ".join(text_parts)
+        # Iterating the lazy segments runs the decoder
+        full_text = " ".join(segment.text.strip() for segment in segments)
 
         return TranscriptionResult(
             text=full_text,
@@ -180,6 +469,210 @@ class Transcriber:
             duration=info.duration,
         )
 
+    def transcribe_stream(
+        self,
+        audio_source: str | bytes | np.ndarray,
+        language: Optional[str] = None,
+        latency_mode: LatencyMode = "quality",
+        vad: VadMode = "auto",
+        min_language_probability: Optional[float] = None,
+    ) -> Generator[tuple[str, float, float], None, TranscriptionResult]:
+        """
+        Transcribe audio, yielding each segment as soon as it is decoded.
+
+        Decoding is driven by iteration, so partial text is available long
+        before the whole clip is done. The full result is the generator's
+        return value (StopIteration.value, or the value of `yield from`).
+
+        Args:
+            audio_source: Same as transcribe()
+            language: Same as transcribe()
+            latency_mode: Same as transcribe()
+            vad: Same as transcribe()
+            min_language_probability: Same as transcribe()
+
+        Yields:
+            (text, start, end) for each segment, with times in seconds
+        """
+        segments, info = self._transcribe_segments(
+            audio_source, language, latency_mode, vad
+        )
+
+        full_text = io.StringIO()
+        if self._language_rejected(language, info, min_language_probability):
+            segments = ()
+
+        for segment in segments:
+            text = segment.text.strip()
+            if full_text.tell():
+                full_text.write(" ")
+            full_text.write(text)
+            yield text, segment.start, segment.end
+
+        return TranscriptionResult(
+            text=full_text.getvalue(),
+            language=info.language,
+            language_probability=info.language_probability,
+            duration=info.duration,
+        )
+
+    def transcribe_chunks(
+        self,
+        audio_source: str | bytes | np.ndarray,
+        chunk_s: float = 4.0,
+        left_context_s: float = 1.0,
+        language: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Transcribe audio step by step, yielding text as soon as it is stable.
+
+        Each step adds chunk_s seconds of audio and re-decodes a window that
+        starts left_context_s before the last committed word, prompting with
+        the committed text so far. A word is committed only once two
+        consecutive windows agree on it (LocalAgreement, as in
+        Whisper-Streaming), so yielded text is never revised.
+
+        Args:
+            audio_source: Same as transcribe()
+            chunk_s: Seconds of new audio per step
+            left_context_s: Seconds of committed audio re-decoded for context
+            language: Same as transcribe()
+
+        Yields:
+            Newly committed text, in order
+        """
+        audio = self._prepare_audio(audio_source)
+        step = max(1, int(chunk_s * _SAMPLE_RATE))
+        max_window = int(_CHUNK_MAX_WINDOW * _SAMPLE_RATE)
+
+        committed: list[str] = []
+        committed_end = 0.0  # End time of the last committed word
+        pending: list[tuple[float, str]] = []  # Uncommitted (end, word) so far
+        window_start = 0
+
+        for end in range(step, len(audio) + step, step):
+            end = min(end, len(audio))
+            is_last = end == len(audio)
+            window_start = max(window_start, end - max_window)
+            offset = window_start / _SAMPLE_RATE
+
+            segments, _ = self._model.transcribe(
+                audio[window_start:end],
+                language=language,
+                initial_prompt=" ".join(committed[-_CHUNK_PROMPT_WORDS:]) or None,
+                condition_on_previous_text=False,
+                vad_filter=True,
+                word_timestamps=True,
+                **_DECODE_OPTIONS["latency"],
+            )
+            # Words after the committed ones, in absolute time
+            hypothesis = [
+                (offset + word.end, word.word.strip())
+                for segment in segments
+                for word in segment.words
+                if offset + word.end > committed_end + _CHUNK_WORD_TOLERANCE
+            ]
+
+            # Commit the prefix this window shares with the previous one;
+            # the final window has nothing left to wait for
+            if is_last:
+                agreed = len(hypothesis)
+            else:
+                agreed = 0
+                for (_, new), (_, old) in zip(hypothesis, pending):
+                    if new.lower() != old.lower():
+                        break
+                    agreed += 1
+
+            if agreed:
+                words = [word for _, word in hypothesis[:agreed]]
+                committed.extend(words)
+                committed_end = hypothesis[agreed - 1][0]
+                context_start = int((committed_end - left_context_s) * _SAMPLE_RATE)
+                window_start = max(window_start, context_start)
+                yield " ".join(words)
+
+            pending = hypothesis[agreed:]
+
+    def _transcribe_segments(
+        self,
+        audio_source: str | bytes | np.ndarray,
+        language: Optional[str],
+        latency_mode: LatencyMode,
+        vad: VadMode,
+    ) -> tuple[Iterable["Segment"], "TranscriptionInfo"]:
+        """Start transcription, returning the lazy segments and audio info."""
+        audio = self._prepare_audio(audio_source)
+        duration = len(audio) / _SAMPLE_RATE
+
+        # Filter out silence, except on clips too short to be worth it
+        if vad == "auto":
+            vad_filter = duration >= _VAD_MIN_DURATION
+        else:
+            vad_filter = vad == "on"
+
+        options = dict(
+            language=language,
+            condition_on_previous_text=False,  # Prevents hallucination in Arabic
+            vad_filter=vad_filter,
+            vad_parameters=_VAD_PARAMETERS if vad_filter else None,
+            **_DECODE_OPTIONS[latency_mode],
+        )
+
+        # Batch longer clips; short push-to-talk clips are a single chunk anyway.
+        # The batched pipeline needs VAD to split the audio into chunks.
+        if vad_filter and duration >= _BATCH_MIN_DURATION:
+            return self._pipeline.transcribe(
+                audio, batch_size=self.batch_size, **options
+            )
+        return self._model.transcribe(audio, **options)
+
+    @staticmethod
+    def _language_rejected(
+        language: Optional[str],
+        info: "TranscriptionInfo",
+        min_probability: Optional[float],
+    ) -> bool:
+        """
+        Check whether decoding should be skipped for an unlikely language.
+
+        Language detection runs before the lazy segments are decoded, so a
+        rejected clip costs only the encoder pass. A caller-provided language
+        skips detection, so there is nothing to check against.
+        """
+        if language is not None or min_probability is None:
+            return False
+        return info.language_probability < min_probability
+
+    @staticmethod
+    def _prepare_audio(audio_source: str | bytes | np.ndarray) -> np.ndarray:
+        """Decode the audio source to 16kHz mono float32 samples."""
+        if isinstance(audio_source, np.ndarray):
+            # Silero VAD expects float32 input (the feature extractor casts
+            # on its own); a no-op for arrays that are already float32
+            return audio_source.astype(np.float32, copy=False)
+
+        # Handle bytes input by wrapping it in a file-like buffer
+        if isinstance(audio_source, bytes):
+            audio_source = io.BytesIO(audio_source)
+
+        from faster_whisper import decode_audio
+
+        return decode_audio(audio_source, sampling_rate=_SAMPLE_RATE)
+
+    def warmup(self) -> None:
+        """
+        Run one second of silence through the model.
+
+        The first decode pays for kernel selection and memory allocation, so
+        doing it up front keeps that cost off the user's first recording.
+        """
+        silence = np.zeros(_SAMPLE_RATE, dtype=np.float32)
+        segments, _ = self._model.transcribe(
+            silence, language="en", beam_size=1, vad_filter=False
+        )
+        list(segments)  # Segments are lazy; consume them to run the decoder
+
     def get_model_info(self) -> dict:
         """Get detailed information about the loaded model and device."""
         info = {
@@ -193,39 +686,6 @@ class Transcriber:
         }
 
         if self.device == "cuda":
-            # Try to get GPU details
-            try:
-                result = subprocess.run(
-                    [
-                        "nvidia-smi",
-                        "--query-gpu=name,memory.total,driver_version",
-                        "--format=csv,noheader,nounits",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    parts = result.stdout.strip().split(", ")
-                    if len(parts) >= 3:
-                        info["gpu_name"] = parts[0].strip()
-                        info["gpu_memory_mb"] = int(parts[1].strip())
-                        info["driver_version"] = parts[2].strip()
-
-                # CUDA version from nvidia-smi header
-                result = subprocess.run(
-                    ["nvidia-smi"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split("\n"):
-                        if "CUDA Version:" in line:
-                            cuda_part = line.split("CUDA Version:")[1].strip()
-                            info["cuda_version"] = cuda_part.split()[0].strip()
-                            break
-            except Exception:
-                pass  # Fallback silently if nvidia-smi fails
+            info.update(_query_gpu_info())
 
         return info